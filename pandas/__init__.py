@@ -160,6 +160,7 @@ from pandas.io.api import (
     read_sql_table,
     # misc
     read_clipboard,
+    ParquetWriter,
     read_parquet,
     read_orc,
     read_feather,
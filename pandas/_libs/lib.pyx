@@ -1,4 +1,5 @@
 from collections import abc
+from copy import deepcopy
 from decimal import Decimal
 import warnings
 
@@ -392,6 +393,121 @@ def dicts_to_array(dicts: list, columns: list):
     return result
 
 
+cdef inline void _set_flat_value(str key, object val, Py_ssize_t row,
+                                 Py_ssize_t n, dict positions, list columns,
+                                 dict memo):
+    cdef:
+        list values
+        object pos = positions.get(key)
+
+    if pos is None:
+        values = [np.nan] * n
+        positions[key] = len(columns)
+        columns.append(values)
+    else:
+        values = columns[pos]
+
+    if not (val is None or isinstance(val, (str, int, float, bool))):
+        # nested_to_record hands out deep copies of the records
+        val = deepcopy(val, memo)
+    values[row] = val
+
+
+cdef int _flatten_dict(dict d, str prefix, str sep, Py_ssize_t level,
+                       Py_ssize_t max_level, Py_ssize_t row, Py_ssize_t n,
+                       dict positions, list columns, dict memo,
+                       list parents) except -1:
+    """
+    Flatten ``d`` into row ``row`` of ``columns``.
+
+    Returns 0 if a key is not a str, or if a flattened name is also a key of
+    ``d`` or one of its parents, where nested_to_record's renaming in place
+    gives results that depend on the order of the keys.
+    """
+    cdef:
+        object key, val, parent
+        str name
+        list nested = []
+
+    parents.append(d)
+    for key, val in d.items():
+        if not isinstance(key, str):
+            return 0
+        name = key if level == 0 else prefix + sep + key
+        if isinstance(val, dict) and (max_level < 0 or level < max_level):
+            if level == 0:
+                # top-level dicts are expanded after the other keys
+                nested.append((name, val))
+            elif not _flatten_dict(val, name, sep, level + 1, max_level, row, n,
+                                   positions, columns, memo, parents):
+                return 0
+        else:
+            if level > 0:
+                for parent in parents:
+                    if name in parent:
+                        return 0
+            _set_flat_value(name, val, row, n, positions, columns, memo)
+
+    for name, val in nested:
+        if not _flatten_dict(val, name, sep, 1, max_level, row, n,
+                             positions, columns, memo, parents):
+            return 0
+    parents.pop()
+    return 1
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def flatten_dicts_to_arrays(dicts: list, sep: str = ".", max_level=None):
+    """
+    Flatten a list of nested dicts into one object array per column.
+
+    Nested keys are joined with ``sep`` and columns are ordered as
+    ``DataFrame(nested_to_record(dicts, sep, max_level=max_level))`` would
+    order them; keys missing from a dict are NaN.
+
+    Parameters
+    ----------
+    dicts : list of dict
+    sep : str, default "."
+    max_level : int, optional
+        Depth to which dicts are flattened, all levels if None.
+
+    Returns
+    -------
+    names : list of str
+    arrays : list of ndarray[object]
+
+    Or None if an item is not a dict or a key is not a str.
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(dicts), depth = -1
+        dict positions = {}
+        list columns = [], values
+        ndarray[object] result
+        object d
+
+    if max_level is not None:
+        depth = max_level
+
+    for i in range(n):
+        d = dicts[i]
+        if not isinstance(d, dict):
+            return None
+        if not _flatten_dict(d, "", sep, 0, depth, i, n, positions, columns,
+                             {}, []):
+            return None
+
+    arrays = []
+    for values in columns:
+        result = np.empty(n, dtype=object)
+        for j in range(n):
+            result[j] = values[j]
+        arrays.append(result)
+
+    return list(positions), arrays
+
+
 def fast_zip(list ndarrays):
     """
     For zipping multiple ndarrays into an ndarray of tuples.
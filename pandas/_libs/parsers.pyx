@@ -12,8 +12,8 @@ import zipfile
 from csv import QUOTE_MINIMAL, QUOTE_NONNUMERIC, QUOTE_NONE
 from errno import ENOENT
 
-from libc.stdlib cimport free
-from libc.string cimport strncpy, strlen, strcasecmp
+from libc.stdlib cimport free, malloc
+from libc.string cimport strncpy, strlen, strcasecmp, strcmp, memcpy
 
 import cython
 from cython import Py_ssize_t
@@ -37,6 +37,10 @@ cnp.import_array()
 from pandas._libs cimport util
 from pandas._libs.util cimport UINT64_MAX, INT64_MAX, INT64_MIN
 import pandas._libs.lib as lib
+from pandas._libs.tslibs.nattype cimport NPY_NAT
+from pandas._libs.tslibs.np_datetime cimport (
+    npy_datetimestruct, dtstruct_to_dt64, dt64_to_dtstruct, dts_out_of_bounds,
+    _cstring_to_dts)
 
 from pandas._libs.khash cimport (
     khiter_t,
@@ -56,6 +60,8 @@ from pandas.core.dtypes.common import (
     is_datetime64_dtype,
     pandas_dtype, is_extension_array_dtype)
 from pandas.core.dtypes.concat import union_categoricals
+from pandas.core.dtypes.dtypes import CategoricalDtype
+from pandas.core.arrays import Categorical
 
 from pandas.compat import _import_lzma, _get_lzma_file
 from pandas.errors import (ParserError, DtypeWarning,
@@ -207,6 +213,10 @@ cdef extern from "parser/tokenizer.h":
 
     int parser_set_skipfirstnrows(parser_t *self, int64_t nrows)
 
+    int parser_set_fixed_width(parser_t *self, int64_t ncols,
+                               const int64_t *starts, const int64_t *ends,
+                               const char *filler)
+
     void parser_set_default_options(parser_t *self)
 
     int parser_consume_rows(parser_t *self, size_t nrows)
@@ -285,13 +295,18 @@ cdef class TextReader:
         object header, orig_header, names, header_start, header_end
         object index_col
         object skiprows
-        object dtype
+        object dtype, dtype_hints
         object encoding
         object compression
         object usecols
         list dtype_cast_order
         set unnamed_cols
         set noconvert
+        set datetime_cols
+        dict datetime_layouts
+        bint keep_datetime_layouts
+        bint dict_strings
+        dict string_dicts
 
     def __cinit__(self, source,
                   delimiter=b',',
@@ -332,7 +347,10 @@ cdef class TextReader:
                   bint verbose=False,
                   bint mangle_dupe_cols=True,
                   float_precision=None,
-                  bint skip_blank_lines=True):
+                  bint skip_blank_lines=True,
+                  string_storage='object',
+                  colspecs=None,
+                  dtype_hints=None):
 
         # set encoding for native Python and C library
         if encoding is not None:
@@ -363,7 +381,10 @@ cdef class TextReader:
 
         parser_init(self.parser)
 
-        if delim_whitespace:
+        if colspecs is not None:
+            # fixed-width fields, the delimiter holds the filler characters
+            self._set_colspecs(colspecs, delimiter)
+        elif delim_whitespace:
             self.parser.delim_whitespace = delim_whitespace
         else:
             if len(delimiter) > 1:
@@ -460,6 +481,12 @@ cdef class TextReader:
         else:
             self.parser.double_converter = xstrtod
 
+        if string_storage not in ('object', 'dict'):
+            raise ValueError(f"string_storage must be 'object' or 'dict', "
+                             f"got {repr(string_storage)}")
+        self.dict_strings = string_storage == 'dict'
+        self.string_dicts = {}
+
         if isinstance(dtype, dict):
             dtype = {k: pandas_dtype(dtype[k])
                      for k in dtype}
@@ -468,8 +495,17 @@ cdef class TextReader:
 
         self.dtype = dtype
 
+        # dtypes inferred from a sample of the file, see infer_schema_rows
+        if dtype_hints is not None:
+            dtype_hints = {k: pandas_dtype(dtype_hints[k])
+                           for k in dtype_hints}
+        self.dtype_hints = dtype_hints
+
         # XXX
         self.noconvert = set()
+        self.datetime_cols = set()
+        self.datetime_layouts = None
+        self.keep_datetime_layouts = False
 
         self.index_col = index_col
 
@@ -527,7 +563,37 @@ cdef class TextReader:
     def __init__(self, *args, **kwargs):
         pass
 
+    cdef _set_colspecs(self, colspecs, filler):
+        cdef:
+            ndarray[int64_t] starts, ends
+            int64_t prev_end = 0
+
+        starts = np.empty(len(colspecs), dtype=np.int64)
+        ends = np.empty(len(colspecs), dtype=np.int64)
+        for i, (start, end) in enumerate(colspecs):
+            # a missing end runs to the end of the line, stored as -1
+            start = 0 if start is None else start
+            if (prev_end < 0 or start < prev_end or
+                    (end is not None and end < start)):
+                raise ValueError('colspecs must be sorted, non-overlapping '
+                                 'and non-negative for the C engine')
+            starts[i] = start
+            ends[i] = prev_end = -1 if end is None else end
+
+        if not filler:
+            filler = ' \t'
+        if not isinstance(filler, bytes):
+            filler = filler.encode('utf-8')
+
+        if parser_set_fixed_width(self.parser, len(colspecs),
+                                  <int64_t *>starts.data,
+                                  <int64_t *>ends.data, filler) < 0:
+            raise MemoryError()
+
     def __dealloc__(self):
+        if self.parser == NULL:
+            # __cinit__ failed before the parser was created
+            return
         parser_free(self.parser)
         if self.true_set:
             kh_destroy_str_starts(self.true_set)
@@ -820,7 +886,14 @@ cdef class TextReader:
     def read(self, rows=None):
         """
         rows=None --> read all rows
+
+        After a low_memory read, or any read if keep_datetime_layouts is
+        set, datetime_layouts maps the columns parsed as dates to what
+        _datetimes_to_strings needs to give back their strings.
         """
+        # string dictionaries are shared by the chunks of a single read
+        self.string_dicts = {}
+
         if self.low_memory:
             # Conserve intermediate space
             columns = self._read_low_memory(rows)
@@ -834,7 +907,10 @@ cdef class TextReader:
         cdef:
             size_t rows_read = 0
             list chunks = []
+            list layouts = []
 
+        # the layouts of the date columns parsed in each chunk, in case
+        # another chunk of the column falls back to strings
         if rows is None:
             while True:
                 try:
@@ -845,6 +921,7 @@ cdef class TextReader:
                     break
                 else:
                     chunks.append(chunk)
+                    layouts.append(self.datetime_layouts)
         else:
             while rows_read < rows:
                 try:
@@ -859,14 +936,19 @@ cdef class TextReader:
                     break
                 else:
                     chunks.append(chunk)
+                    layouts.append(self.datetime_layouts)
 
         parser_trim_buffers(self.parser)
 
         if len(chunks) == 0:
             raise StopIteration
 
+        encoding = self.encoding.decode('utf-8') if self.encoding else 'utf-8'
+
         # destructive to chunks
-        return _concatenate_chunks(chunks)
+        columns = _concatenate_chunks(chunks, layouts, encoding)
+        self.datetime_layouts = _concatenate_layouts(columns, layouts)
+        return columns
 
     cdef _tokenize_rows(self, size_t nrows):
         cdef:
@@ -890,6 +972,11 @@ cdef class TextReader:
 
         self._start_clock()
 
+        if self.low_memory or self.keep_datetime_layouts:
+            self.datetime_layouts = {}
+        else:
+            self.datetime_layouts = None
+
         if rows is not None:
             irows = rows
             buffered_lines = self.parser.lines - self.parser_start
@@ -948,6 +1035,15 @@ cdef class TextReader:
     def remove_noconvert(self, i):
         self.noconvert.remove(i)
 
+    def set_datetime(self, i):
+        """
+        Parse the noconvert column i straight to datetime64[ns] when all of
+        its values are timezone-naive ISO 8601 strings. Columns that do not
+        qualify are returned as strings, like any other noconvert column.
+        """
+        self.noconvert.add(i)
+        self.datetime_cols.add(i)
+
     def _convert_column_data(self, rows=None, upcast_na=False, footer=0):
         cdef:
             int64_t i
@@ -1021,6 +1117,13 @@ cdef class TextReader:
                     else:
                         col_dtype = self.dtype
 
+            dtype_hint = None
+            if col_dtype is None and self.dtype_hints is not None:
+                if name in self.dtype_hints:
+                    dtype_hint = self.dtype_hints[name]
+                elif i in self.dtype_hints:
+                    dtype_hint = self.dtype_hints[i]
+
             if conv:
                 if col_dtype is not None:
                     warnings.warn((f"Both a converter and dtype were specified "
@@ -1051,7 +1154,7 @@ cdef class TextReader:
             try:
                 col_res, na_count = self._convert_tokens(
                     i, start, end, name, na_filter, na_hashset,
-                    na_flist, col_dtype)
+                    na_flist, col_dtype, dtype_hint)
             finally:
                 # gh-21353
                 #
@@ -1077,7 +1180,8 @@ cdef class TextReader:
     cdef inline _convert_tokens(self, Py_ssize_t i, int start, int end,
                                 object name, bint na_filter,
                                 kh_str_starts_t *na_hashset,
-                                object na_flist, object col_dtype):
+                                object na_flist, object col_dtype,
+                                object dtype_hint=None):
 
         if col_dtype is not None:
             col_res, na_count = self._convert_with_dtype(
@@ -1088,8 +1192,35 @@ cdef class TextReader:
             # but its actually a float).
             if col_res is not None:
                 return col_res, na_count
+        elif dtype_hint is not None and i not in self.noconvert:
+            # A single pass with the dtype inferred for the whole file;
+            # only a chunk that does not fit it goes through inference below.
+            try:
+                col_res, na_count = self._convert_with_dtype(
+                    dtype_hint, i, start, end, na_filter,
+                    0, na_hashset, na_flist)
+            except (ValueError, OverflowError):
+                col_res = None
+
+            if col_res is not None:
+                return col_res, na_count
 
         if i in self.noconvert:
+            if i in self.datetime_cols:
+                keep_layout = self.datetime_layouts is not None
+                col_res, na_count, layout = _try_datetime64(
+                    self.parser, i, start, end, na_filter, na_hashset,
+                    keep_layout)
+                if col_res is not None:
+                    if keep_layout:
+                        if layout is None:
+                            # the dates do not share one layout, so keep
+                            # their tokens instead
+                            layout = _datetime_tokens(self.parser, i, start,
+                                                      end, na_filter,
+                                                      na_hashset)
+                        self.datetime_layouts[i] = [(end - start, layout)]
+                    return col_res, na_count
             return self._string_convert(i, start, end, na_filter, na_hashset)
         else:
             col_res = None
@@ -1220,6 +1351,9 @@ cdef class TextReader:
             return self._string_convert(i, start, end, na_filter,
                                         na_hashset)
         elif is_object_dtype(dtype):
+            if self.dict_strings and not user_dtype:
+                return self._dict_encode(i, start, end, na_filter,
+                                         na_hashset)
             return self._string_convert(i, start, end, na_filter,
                                         na_hashset)
         elif is_datetime64_dtype(dtype):
@@ -1241,6 +1375,20 @@ cdef class TextReader:
             return _string_box_decode(self.parser, i, start, end,
                                       na_filter, na_hashset, self.c_encoding)
 
+    cdef _dict_encode(self, Py_ssize_t i, int64_t start, int64_t end,
+                      bint na_filter, kh_str_starts_t *na_hashset):
+        cdef _StringDictionary dictionary
+
+        dictionary = self.string_dicts.get(i)
+        if dictionary is None:
+            dictionary = self.string_dicts[i] = _StringDictionary()
+
+        codes, na_count = _dict_encode(self.parser, i, start, end, na_filter,
+                                       na_hashset, self.c_encoding,
+                                       dictionary)
+        dtype = CategoricalDtype(dictionary.categories)
+        return Categorical(codes, dtype=dtype, fastpath=True), na_count
+
     def _get_converter(self, i, name):
         if self.converters is None:
             return None
@@ -1563,6 +1711,113 @@ cdef _categorical_convert(parser_t *parser, int64_t col,
     return np.asarray(codes), result, na_count
 
 
+cdef class _StringDictionary:
+    """
+    Append-only table of the distinct strings in one column. It is shared by
+    the chunks of a low_memory read, so the codes of every chunk index into
+    the same categories.
+    """
+    cdef:
+        kh_str_t *table
+        list categories
+
+    def __cinit__(self):
+        self.table = kh_init_str()
+        self.categories = []
+
+    def __dealloc__(self):
+        cdef:
+            khiter_t k
+
+        if self.table is not NULL:
+            # the keys are copies owned by the table
+            for k in range(self.table.n_buckets):
+                if kh_exist_str(self.table, k):
+                    free(<char *>self.table.keys[k])
+            kh_destroy_str(self.table)
+            self.table = NULL
+
+
+@cython.boundscheck(False)
+cdef _dict_encode(parser_t *parser, int64_t col,
+                  int64_t line_start, int64_t line_end,
+                  bint na_filter, kh_str_starts_t *na_hashset,
+                  char *encoding, _StringDictionary dictionary):
+    "Convert column data into codes, adding new values to the dictionary"
+    cdef:
+        int na_count = 0
+        Py_ssize_t i, size, lines
+        coliter_t it
+        const char *word = NULL
+        char *key
+
+        int64_t NA = -1
+        int64_t[:] codes
+        int64_t n_known = len(dictionary.categories)
+        int64_t current_category = n_known
+        bint out_of_memory = False
+
+        char *errors = "strict"
+        StringPath path = _string_path(encoding)
+
+        int ret = 0
+        kh_str_t *table = dictionary.table
+        khiter_t k
+        list new_categories
+
+    lines = line_end - line_start
+    codes = np.empty(lines, dtype=np.int64)
+
+    with nogil:
+        coliter_setup(&it, parser, col, line_start)
+
+        for i in range(lines):
+            COLITER_NEXT(it, word)
+
+            if na_filter:
+                if kh_get_str_starts_item(na_hashset, word):
+                    # is in NA values
+                    na_count += 1
+                    codes[i] = NA
+                    continue
+
+            k = kh_get_str(table, word)
+            # not in the hash table
+            if k == table.n_buckets:
+                # the tokenizer reuses its buffers between chunks, so
+                # the table keeps its own copy of the word
+                size = strlen(word) + 1
+                key = <char *>malloc(size)
+                if key is NULL:
+                    out_of_memory = True
+                    break
+                memcpy(key, word, size)
+                k = kh_put_str(table, key, &ret)
+                table.vals[k] = current_category
+                current_category += 1
+
+            codes[i] = table.vals[k]
+
+    if out_of_memory:
+        raise MemoryError()
+
+    # box the new categories to python strings
+    if current_category > n_known:
+        new_categories = [None] * (current_category - n_known)
+        for k in range(table.n_buckets):
+            if kh_exist_str(table, k) and <int64_t>table.vals[k] >= n_known:
+                if path == ENCODED:
+                    size = strlen(table.keys[k])
+                    value = PyUnicode_Decode(table.keys[k], size,
+                                             encoding, errors)
+                else:
+                    value = PyUnicode_FromString(table.keys[k])
+                new_categories[<int64_t>table.vals[k] - n_known] = value
+        dictionary.categories.extend(new_categories)
+
+    return np.asarray(codes), na_count
+
+
 cdef _to_fw_string(parser_t *parser, int64_t col, int64_t line_start,
                    int64_t line_end, int64_t width):
     cdef:
@@ -1843,6 +2098,213 @@ cdef inline int _try_int64_nogil(parser_t *parser, int64_t col,
     return 0
 
 
+# the digits of a date down to the nanoseconds, see _datetime_digits
+DEF DATETIME_DIGITS = 23
+
+
+cdef _try_datetime64(parser_t *parser, int64_t col,
+                     int64_t line_start, int64_t line_end,
+                     bint na_filter, kh_str_starts_t *na_hashset,
+                     bint keep_layout=False):
+    """
+    Parse ISO 8601 tokens straight into a datetime64[ns] array without
+    creating string objects. Returns (None, None, None) if any token is not
+    a timezone-naive ISO 8601 date within the nanosecond bounds.
+
+    With keep_layout, the third item is the layout the tokens share (see
+    _matches_layout), or None if they do not share one.
+    """
+    cdef:
+        int error, na_count = 0
+        bint uniform = keep_layout
+        Py_ssize_t lines
+        int64_t *data
+        const char *layout = NULL
+        ndarray result
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype='M8[ns]')
+    data = <int64_t *>result.data
+    with nogil:
+        error = _try_datetime64_nogil(parser, col, line_start, line_end,
+                                      na_filter, na_hashset, data, &na_count,
+                                      &uniform, &layout)
+    if error != 0:
+        return None, None, None
+    if not uniform:
+        return result, na_count, None
+    # copy the layout out of the parser's buffers
+    return result, na_count, b'' if layout == NULL else <bytes>layout
+
+
+cdef _datetime_tokens(parser_t *parser, int64_t col,
+                      int64_t line_start, int64_t line_end,
+                      bint na_filter, kh_str_starts_t *na_hashset):
+    """
+    Copy the tokens of a column parsed by _try_datetime64 into a fixed-width
+    bytes array, along with a mask of the tokens that are NA values, so that
+    the column can be turned back into the strings _string_convert returns.
+    """
+    cdef:
+        Py_ssize_t i, size, itemsize = 1, lines = line_end - line_start
+        coliter_t it
+        const char *word = NULL
+        char *data
+        ndarray values
+        ndarray[uint8_t] mask
+
+    coliter_setup(&it, parser, col, line_start)
+    for i in range(lines):
+        COLITER_NEXT(it, word)
+        itemsize = max(itemsize, <Py_ssize_t>strlen(word))
+
+    values = np.zeros(lines, dtype=f'S{itemsize}')
+    mask = np.zeros(lines, dtype=np.uint8)
+    data = values.data
+    coliter_setup(&it, parser, col, line_start)
+    for i in range(lines):
+        COLITER_NEXT(it, word)
+        if na_filter and kh_get_str_starts_item(na_hashset, word):
+            mask[i] = 1
+        else:
+            size = strlen(word)
+            memcpy(data + i * itemsize, word, size)
+
+    return values, mask.view(np.bool_)
+
+
+cdef inline bint _is_nat_word(const char *word) nogil:
+    # matches the strings to_datetime treats as NaT
+    return (word[0] == b'\0' or
+            strcmp(word, b'NaT') == 0 or strcmp(word, b'nat') == 0 or
+            strcmp(word, b'NAT') == 0 or strcmp(word, b'nan') == 0 or
+            strcmp(word, b'NaN') == 0 or strcmp(word, b'NAN') == 0)
+
+
+cdef inline int _try_datetime64_nogil(parser_t *parser, int64_t col,
+                                      int64_t line_start, int64_t line_end,
+                                      bint na_filter,
+                                      const kh_str_starts_t *na_hashset,
+                                      int64_t *data, int *na_count,
+                                      bint *uniform,
+                                      const char **layout) nogil:
+    cdef:
+        Py_ssize_t i, lines = line_end - line_start, layout_len = 0
+        coliter_t it
+        const char *word = NULL
+        npy_datetimestruct dts
+        int out_local = 0, out_tzoffset = 0
+
+    na_count[0] = 0
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        COLITER_NEXT(it, word)
+        if na_filter and kh_get_str_starts_item(na_hashset, word):
+            na_count[0] += 1
+            data[i] = NPY_NAT
+            continue
+        if _is_nat_word(word):
+            # unlike an NA value, this token stays as is in a string column
+            uniform[0] = False
+            na_count[0] += 1
+            data[i] = NPY_NAT
+            continue
+
+        if _cstring_to_dts(word, strlen(word), &dts,
+                           &out_local, &out_tzoffset) != 0:
+            return 1
+        if out_local or dts_out_of_bounds(&dts):
+            # leave timezone offsets and out-of-bounds handling to
+            # to_datetime
+            return 1
+        data[i] = dtstruct_to_dt64(&dts)
+
+        if uniform[0]:
+            if layout[0] == NULL:
+                layout[0] = word
+                layout_len = strlen(word)
+            uniform[0] = _matches_layout(word, layout[0], layout_len, &dts)
+
+    return 0
+
+
+cdef inline void _datetime_digits(const npy_datetimestruct *dts,
+                                  char *digits) nogil:
+    # the DATETIME_DIGITS digits of an ISO 8601 date in the order they are
+    # written, from the year down to the nanoseconds
+    _write_digits(digits, dts.year, 4)
+    _write_digits(digits + 4, dts.month, 2)
+    _write_digits(digits + 6, dts.day, 2)
+    _write_digits(digits + 8, dts.hour, 2)
+    _write_digits(digits + 10, dts.min, 2)
+    _write_digits(digits + 12, dts.sec, 2)
+    _write_digits(digits + 14, dts.us, 6)
+    _write_digits(digits + 20, dts.ps // 1000, 3)
+
+
+cdef inline void _write_digits(char *out, int64_t value, int width) nogil:
+    cdef int i
+    for i in range(width - 1, -1, -1):
+        out[i] = c'0' + <char>(value % 10)
+        value = value // 10
+
+
+cdef inline bint _matches_layout(const char *word, const char *layout,
+                                 Py_ssize_t layout_len,
+                                 const npy_datetimestruct *dts) nogil:
+    """
+    Whether word is layout with its digits replaced, in order, by those of
+    dts. A chunk of dates whose tokens all match the layout of the first
+    one only needs that layout to be written back as strings.
+    """
+    cdef:
+        Py_ssize_t i, k = 0
+        char digits[DATETIME_DIGITS]
+
+    if <Py_ssize_t>strlen(word) != layout_len:
+        return False
+    _datetime_digits(dts, digits)
+    for i in range(layout_len):
+        if c'0' <= layout[i] <= c'9':
+            if k == DATETIME_DIGITS or word[i] != digits[k]:
+                return False
+            k += 1
+        elif word[i] != layout[i]:
+            return False
+    return True
+
+
+cdef _layout_to_strings(ndarray values, bytes layout, object encoding):
+    """
+    Write the dates of a chunk parsed by _try_datetime64 back into the
+    layout their tokens shared, with NA values for NaT.
+    """
+    cdef:
+        Py_ssize_t i, j, k, n = len(values), layout_len = len(layout)
+        ndarray[int64_t] data = values.view(np.int64)
+        ndarray result = np.empty(n, dtype=np.object_)
+        const char *src = layout
+        bytearray buf = bytearray(layout)
+        char *out = buf
+        char digits[DATETIME_DIGITS]
+        npy_datetimestruct dts
+
+    for i in range(n):
+        if data[i] == NPY_NAT:
+            result[i] = na_values[np.object_]
+            continue
+        dt64_to_dtstruct(data[i], &dts)
+        _datetime_digits(&dts, digits)
+        k = 0
+        for j in range(layout_len):
+            if c'0' <= src[j] <= c'9':
+                out[j] = digits[k]
+                k += 1
+        result[i] = buf.decode(encoding)
+    return result
+
+
 cdef _try_bool_flex(parser_t *parser, int64_t col,
                     int64_t line_start, int64_t line_end,
                     bint na_filter, const kh_str_starts_t *na_hashset,
@@ -2021,7 +2483,52 @@ cdef raise_parser_error(object base, parser_t *parser):
     raise ParserError(message)
 
 
-def _concatenate_chunks(list chunks):
+_M8_NS = np.dtype('M8[ns]')
+
+
+def _tokens_to_strings(ndarray values, ndarray mask, object encoding):
+    result = np.empty(len(values), dtype=np.object_)
+    result[:] = [value.decode(encoding) for value in values]
+    result[mask] = na_values[np.object_]
+    return result
+
+
+def _datetimes_to_strings(ndarray values, list layouts, object encoding):
+    """
+    Give back the strings of a column parsed by _try_datetime64 from the
+    (length, layout) pairs recorded for each run of its rows, where layout
+    is either the layout the tokens shared or the tokens themselves.
+    """
+    cdef:
+        Py_ssize_t start = 0, stop
+
+    result = np.empty(len(values), dtype=np.object_)
+    for length, layout in layouts:
+        stop = start + length
+        if isinstance(layout, bytes):
+            result[start:stop] = _layout_to_strings(values[start:stop],
+                                                    layout, encoding)
+        else:
+            result[start:stop] = _tokens_to_strings(*layout, encoding)
+        start = stop
+    return result
+
+
+def _concatenate_layouts(dict columns, list layouts):
+    """
+    Join the layouts recorded for the chunks of the columns that were
+    parsed as dates in every chunk.
+    """
+    result = {}
+    for name, values in columns.items():
+        if values.dtype == _M8_NS:
+            result[name] = [layout for chunk_layouts in layouts
+                            for layout in chunk_layouts[name]]
+    return result
+
+
+def _concatenate_chunks(list chunks, list layouts=None,
+                        object encoding='utf-8'):
     cdef:
         list names = list(chunks[0].keys())
         object name
@@ -2034,6 +2541,20 @@ def _concatenate_chunks(list chunks):
         arrs = [chunk.pop(name) for chunk in chunks]
         # Check each arr for consistent types.
         dtypes = {a.dtype for a in arrs}
+        if len(dtypes) > 1 and _M8_NS in dtypes and layouts is not None:
+            # a date column fell back to strings part way through the file,
+            # so return the strings of the chunks that were parsed as dates
+            arrs = [_datetimes_to_strings(a, chunk_layouts[name], encoding)
+                    if a.dtype == _M8_NS else a
+                    for a, chunk_layouts in zip(arrs, layouts)]
+            dtypes = {a.dtype for a in arrs}
+        is_categorical = [isinstance(a, Categorical) for a in arrs]
+        if any(is_categorical) and not all(is_categorical):
+            # a dictionary-encoded string chunk next to a chunk parsed as
+            # another dtype, so mix them as object like the string chunks
+            arrs = [np.asarray(a, dtype=object) if isinstance(a, Categorical)
+                    else a for a in arrs]
+            dtypes = {a.dtype for a in arrs}
         numpy_dtypes = {x for x in dtypes if not is_categorical_dtype(x)}
         if len(numpy_dtypes) > 1:
             common_type = np.find_common_type(numpy_dtypes, [])
@@ -2042,9 +2563,11 @@ def _concatenate_chunks(list chunks):
 
         dtype = dtypes.pop()
         if is_categorical_dtype(dtype):
-            sort_categories = isinstance(dtype, str)
-            result[name] = union_categoricals(arrs,
-                                              sort_categories=sort_categories)
+            result[name] = _concatenate_shared_categoricals(arrs)
+            if result[name] is None:
+                sort_categories = isinstance(dtype, str)
+                result[name] = union_categoricals(
+                    arrs, sort_categories=sort_categories)
         else:
             if is_extension_array_dtype(dtype):
                 array_type = dtype.construct_array_type()
@@ -2063,6 +2586,23 @@ def _concatenate_chunks(list chunks):
 
 
 # ----------------------------------------------------------------------
+def _concatenate_shared_categoricals(list arrs):
+    """
+    Concatenate Categoricals whose categories all start with those of the
+    previous chunks, as produced by dictionary encoding, by joining their
+    codes. Returns None if the categories are not shared this way.
+    """
+    widest = max(arrs, key=lambda arr: len(arr.categories))
+    categories = widest.categories
+    for arr in arrs:
+        n = len(arr.categories)
+        if arr is not widest and not categories[:n].equals(arr.categories):
+            return None
+
+    codes = np.concatenate([arr.codes for arr in arrs])
+    return Categorical(codes, dtype=widest.dtype, fastpath=True)
+
+
 # NA values
 def _compute_na_values():
     int64info = np.iinfo(np.int64)
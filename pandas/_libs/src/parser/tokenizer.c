@@ -129,6 +129,10 @@ int parser_cleanup(parser_t *self) {
         self->skipset = NULL;
     }
 
+    free_if_not_null((void *)&self->fw_starts);
+    free_if_not_null((void *)&self->fw_ends);
+    self->fw_ncols = 0;
+
     if (parser_clear_data_buffers(self) < 0) {
         status = -1;
     }
@@ -555,6 +559,38 @@ int parser_set_skipfirstnrows(parser_t *self, int64_t nrows) {
     return 0;
 }
 
+int parser_set_fixed_width(parser_t *self, int64_t ncols,
+                           const int64_t *starts, const int64_t *ends,
+                           const char *filler) {
+    // switch the tokenizer to fixed-width fields: column i covers the
+    // characters [starts[i], ends[i]) of each line, ends[i] == -1 meaning
+    // the end of the line. The columns must be sorted and not overlap.
+    free_if_not_null((void *)&self->fw_starts);
+    free_if_not_null((void *)&self->fw_ends);
+    self->fw_ncols = 0;
+
+    self->fw_starts = (int64_t *)malloc(ncols * sizeof(int64_t));
+    self->fw_ends = (int64_t *)malloc(ncols * sizeof(int64_t));
+    if (self->fw_starts == NULL || self->fw_ends == NULL) {
+        free_if_not_null((void *)&self->fw_starts);
+        free_if_not_null((void *)&self->fw_ends);
+        return PARSER_OUT_OF_MEMORY;
+    }
+    memcpy(self->fw_starts, starts, ncols * sizeof(int64_t));
+    memcpy(self->fw_ends, ends, ncols * sizeof(int64_t));
+
+    memset(self->fw_filler, 0, sizeof(self->fw_filler));
+    for (; *filler != '\0'; ++filler) {
+        self->fw_filler[(unsigned char)*filler] = 1;
+    }
+
+    self->fw_ncols = ncols;
+    self->fw_col = 0;
+    self->fw_pos = 0;
+
+    return 0;
+}
+
 static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
     int status;
     size_t bytes_read;
@@ -1131,6 +1167,257 @@ linelimit:
     return 0;
 }
 
+/*
+
+  Fixed-width tokenization
+
+*/
+
+#define FW_FIELD_IS_EMPTY() (self->stream_len == (uint64_t)self->word_start)
+
+#define IS_FW_FILLER(c) (self->fw_filler[(unsigned char)(c)])
+
+// UTF-8 continuation bytes belong to the character before them
+#define IS_CONTINUATION_BYTE(c) (((c) & 0xC0) == 0x80)
+
+#define END_FW_LINE_STATE(STATE)                                     \
+    if (end_fw_line(self) < 0) {                                     \
+        goto parsingerror;                                           \
+    }                                                                \
+    self->state = STATE;                                             \
+    if (line_limit > 0 && self->lines == start_lines + line_limit) { \
+        goto linelimit;                                              \
+    }
+
+static int end_fw_field(parser_t *self) {
+    // strip trailing filler characters
+    while (!FW_FIELD_IS_EMPTY() &&
+           IS_FW_FILLER(self->stream[self->stream_len - 1])) {
+        self->stream_len--;
+    }
+
+    self->fw_col++;
+    return end_field(self);
+}
+
+// whether a UTF-8 word holds only what Python's str.strip() removes
+static int is_whitespace_word(const char *word) {
+    const unsigned char *c = (const unsigned char *)word;
+
+    while (*c != '\0') {
+        if (*c == ' ' || (*c >= '\t' && *c <= '\r') ||
+            (*c >= 0x1C && *c <= 0x1F)) {
+            c += 1;
+        } else if (c[0] == 0xC2 && (c[1] == 0x85 || c[1] == 0xA0)) {
+            // U+0085, U+00A0
+            c += 2;
+        } else if ((c[0] == 0xE1 && c[1] == 0x9A && c[2] == 0x80) ||
+                   (c[0] == 0xE2 && c[1] == 0x80 &&
+                    (c[2] <= 0x8A || c[2] == 0xA8 || c[2] == 0xA9 ||
+                     c[2] == 0xAF) && c[2] >= 0x80) ||
+                   (c[0] == 0xE2 && c[1] == 0x81 && c[2] == 0x9F) ||
+                   (c[0] == 0xE3 && c[1] == 0x80 && c[2] == 0x80)) {
+            // U+1680, U+2000-U+200A, U+2028, U+2029, U+202F, U+205F,
+            // U+3000
+            c += 3;
+        } else {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+static int end_fw_line(parser_t *self) {
+    // close the field in progress and those the line was too short for
+    while (self->fw_col < self->fw_ncols) {
+        if (end_fw_field(self) < 0) {
+            return -1;
+        }
+    }
+    self->fw_col = 0;
+    self->fw_pos = 0;
+
+    // a single empty or whitespace column is a blank line, even when
+    // the filler characters are not whitespace
+    if (self->skip_empty_lines && self->fw_ncols == 1 &&
+        is_whitespace_word(self->words[self->words_len - 1])) {
+        self->words_len--;
+        self->line_fields[self->lines]--;
+        self->stream_len = self->word_starts[self->words_len];
+        self->pword_start = self->stream + self->stream_len;
+        self->word_start = self->stream_len;
+        self->file_lines++;
+        return 0;
+    }
+
+    return end_line(self);
+}
+
+int tokenize_fwf_bytes(parser_t *self,
+                       size_t line_limit, uint64_t start_lines) {
+    int64_t i, pos;
+    int should_skip;
+    char c;
+    char *buf = self->data + self->datapos;
+
+    const char line_terminator = (self->lineterminator == '\0') ?
+            '\n' : self->lineterminator;
+
+    // 1000 is something that couldn't fit in "char"
+    // thus comparing a char to it would always be "false"
+    const int carriage_symbol = (self->lineterminator == '\0') ? '\r' : 1000;
+    const int comment_symbol = (self->commentchar != '\0') ?
+            self->commentchar : 1000;
+
+    if (make_stream_space(self, self->datalen - self->datapos +
+                                self->fw_ncols) < 0) {
+        int64_t bufsize = 100;
+        self->error_msg = (char *)malloc(bufsize);
+        snprintf(self->error_msg, bufsize, "out of memory");
+        return -1;
+    }
+
+    if (self->file_lines == 0) {
+        CHECK_FOR_BOM();
+    }
+
+    for (i = self->datapos; i < self->datalen; ++i) {
+        // next character in file
+        c = *buf++;
+
+        switch (self->state) {
+            case IN_FIELD_IN_SKIP_LINE:
+                if (IS_TERMINATOR(c)) {
+                    if (end_line(self) < 0) {
+                        goto parsingerror;
+                    }
+                    self->state = START_RECORD;
+                } else if (IS_CARRIAGE(c)) {
+                    self->file_lines++;
+                    self->state = EAT_CRNL_NOP;
+                }
+                break;
+
+            case EAT_LINE_COMMENT:
+                if (IS_TERMINATOR(c)) {
+                    self->file_lines++;
+                    self->state = START_RECORD;
+                } else if (IS_CARRIAGE(c)) {
+                    self->file_lines++;
+                    self->state = EAT_CRNL_NOP;
+                }
+                break;
+
+            case EAT_COMMENT:
+                // the rest of the line is a comment
+                if (IS_TERMINATOR(c)) {
+                    END_FW_LINE_STATE(START_RECORD);
+                } else if (IS_CARRIAGE(c)) {
+                    END_FW_LINE_STATE(EAT_CRNL_NOP);
+                }
+                break;
+
+            case EAT_CRNL_NOP:
+                // a line ended with \r, skip the \n of a \r\n
+                self->state = START_RECORD;
+                if (c == '\n') {
+                    break;
+                }
+                // fall through
+
+            case START_RECORD:
+                should_skip = skip_this_line(self, self->file_lines);
+
+                if (should_skip == -1) {
+                    goto parsingerror;
+                } else if (should_skip) {
+                    if (IS_TERMINATOR(c)) {
+                        self->state = IN_FIELD_IN_SKIP_LINE;
+                        if (end_line(self) < 0) {
+                            goto parsingerror;
+                        }
+                        self->state = START_RECORD;
+                    } else if (IS_CARRIAGE(c)) {
+                        self->file_lines++;
+                        self->state = EAT_CRNL_NOP;
+                    } else {
+                        self->state = IN_FIELD_IN_SKIP_LINE;
+                    }
+                    break;
+                }
+
+                // a line produces one word per column, however short it is
+                if (make_stream_space(self, self->datalen - i +
+                                            self->fw_ncols) < 0) {
+                    int64_t bufsize = 100;
+                    self->error_msg = (char *)malloc(bufsize);
+                    snprintf(self->error_msg, bufsize, "out of memory");
+                    goto parsingerror;
+                }
+
+                self->fw_col = 0;
+                self->fw_pos = 0;
+                self->state = IN_FIELD;
+                // fall through
+
+            case IN_FIELD:
+                if (IS_TERMINATOR(c)) {
+                    END_FW_LINE_STATE(START_RECORD);
+                    break;
+                } else if (IS_CARRIAGE(c)) {
+                    END_FW_LINE_STATE(EAT_CRNL_NOP);
+                    break;
+                }
+
+                pos = IS_CONTINUATION_BYTE(c) ? self->fw_pos - 1
+                                              : self->fw_pos++;
+
+                // close the fields that end before this character
+                while (self->fw_col < self->fw_ncols &&
+                       self->fw_ends[self->fw_col] >= 0 &&
+                       pos >= self->fw_ends[self->fw_col]) {
+                    if (end_fw_field(self) < 0) {
+                        goto parsingerror;
+                    }
+                }
+
+                if (self->fw_col == self->fw_ncols ||
+                    pos < self->fw_starts[self->fw_col]) {
+                    // between or after the columns
+                    break;
+                }
+
+                if (IS_COMMENT_CHAR(c)) {
+                    if (self->fw_col == 0 && FW_FIELD_IS_EMPTY()) {
+                        // the whole line is a comment
+                        self->state = EAT_LINE_COMMENT;
+                    } else {
+                        self->state = EAT_COMMENT;
+                    }
+                } else if (FW_FIELD_IS_EMPTY() && IS_FW_FILLER(c)) {
+                    // strip leading filler characters
+                } else if (push_char(self, c) < 0) {
+                    goto parsingerror;
+                }
+                break;
+
+            default:
+                break;
+        }
+    }
+
+    self->datapos = i;
+    return 0;
+
+parsingerror:
+    self->datapos = i + 1;
+    return -1;
+
+linelimit:
+    self->datapos = i + 1;
+    return 0;
+}
+
 static int parser_handle_eof(parser_t *self) {
     int64_t bufsize = 100;
 
@@ -1139,6 +1426,20 @@ static int parser_handle_eof(parser_t *self) {
 
     if (self->datalen != 0) return -1;
 
+    if (self->fw_ncols > 0) {
+        switch (self->state) {
+            case IN_FIELD:
+            case EAT_COMMENT:
+                return end_fw_line(self);
+
+            case IN_FIELD_IN_SKIP_LINE:
+                return end_line(self);
+
+            default:
+                return 0;
+        }
+    }
+
     switch (self->state) {
         case START_RECORD:
         case WHITESPACE_LINE:
@@ -1379,7 +1680,11 @@ int _tokenize_helper(parser_t *self, size_t nrows, int all) {
              "datapos= %d\n",
              self->datalen - self->datapos, self->datalen, self->datapos));
 
-        status = tokenize_bytes(self, nrows, start_lines);
+        if (self->fw_ncols > 0) {
+            status = tokenize_fwf_bytes(self, nrows, start_lines);
+        } else {
+            status = tokenize_bytes(self, nrows, start_lines);
+        }
 
         if (status < 0) {
             // XXX
@@ -163,6 +163,14 @@ typedef struct parser_t {
     char *error_msg;
 
     int skip_empty_lines;
+
+    // fixed-width fields
+    int64_t fw_ncols;       // Number of fixed-width columns, 0 if delimited
+    int64_t *fw_starts;     // Character offset of the start of each column
+    int64_t *fw_ends;       // Offset of the end of each column, -1 for EOL
+    int64_t fw_col;         // Column of the current field
+    int64_t fw_pos;         // Character offset in the current line
+    char fw_filler[256];    // Characters stripped from both ends of fields
 } parser_t;
 
 typedef struct coliter_t {
@@ -191,6 +199,10 @@ int parser_add_skiprow(parser_t *self, int64_t row);
 
 int parser_set_skipfirstnrows(parser_t *self, int64_t nrows);
 
+int parser_set_fixed_width(parser_t *self, int64_t ncols,
+                           const int64_t *starts, const int64_t *ends,
+                           const char *filler);
+
 void parser_free(parser_t *self);
 
 void parser_del(parser_t *self);
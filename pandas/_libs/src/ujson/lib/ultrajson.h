@@ -250,6 +250,11 @@ typedef struct __JSONObjectEncoder {
   Configuration for spaces of indent */
   int indent;
 
+  /*
+  If true, the elements of a top-level array are separated by newlines and
+  the enclosing brackets are omitted (JSON Lines) */
+  int lines;
+
   /*
   Set to an error message if error occurred */
   const char *errorMsg;
@@ -975,6 +975,23 @@ void encode(JSOBJ obj, JSONObjectEncoder *enc, const char *name,
             count = 0;
             enc->iterBegin(obj, &tc);
 
+            if (enc->lines && enc->level == 0) {
+                while (enc->iterNext(obj, &tc)) {
+                    if (count > 0) {
+                        Buffer_AppendCharUnchecked(enc, '\n');
+                    }
+
+                    iterObj = enc->iterGetValue(obj, &tc);
+
+                    enc->level++;
+                    encode(iterObj, enc, NULL, 0);
+                    count++;
+                }
+
+                enc->iterEnd(obj, &tc);
+                break;
+            }
+
             Buffer_AppendCharUnchecked(enc, '[');
             Buffer_AppendIndentNewlineUnchecked (enc);
 
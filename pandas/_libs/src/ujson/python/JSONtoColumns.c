@@ -0,0 +1,574 @@
+/*
+Copyright (c) 2020, PyData Development Team
+All rights reserved.
+
+Distributed under the terms of the BSD Simplified License.
+
+The full license is in the LICENSE file, distributed with this software.
+*/
+
+// Columnar decoding of a JSON array of flat objects (orient="records" and
+// line-delimited JSON).
+//
+// The ultrajson callbacks below do not create Python objects. Each value is
+// stored in a per-key column buffer as a type tag plus an 8 byte payload
+// (strings are copied into a per-column arena), so the whole document can be
+// tokenized without holding the GIL. The buffers are then turned into numpy
+// arrays: int64, float64 and bool columns directly, anything else as an
+// object array for the caller to infer.
+//
+// Documents that are not a list of flat objects (nested values, scalars at
+// the top level, ...) make loads_columns return None so the caller can fall
+// back to the regular decoder.
+
+#define PY_ARRAY_UNIQUE_SYMBOL UJSON_NUMPY
+#define NO_IMPORT_ARRAY
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <numpy/arrayobject.h>
+#include <string.h>
+#include <ultrajson.h>
+
+enum ColTag {
+    TAG_MISSING = 0,  // key not present in the record
+    TAG_NULL,
+    TAG_TRUE,
+    TAG_FALSE,
+    TAG_INT,
+    TAG_DOUBLE,
+    TAG_STRING
+};
+
+typedef struct __ColValue {
+    int tag;
+    int64_t ival;
+    double dval;
+    wchar_t *str;
+    size_t len;
+    size_t cap;
+} ColValue;
+
+typedef struct __Column {
+    wchar_t *name;
+    size_t name_len;
+
+    Py_ssize_t len;  // number of rows with a tag, trailing rows are missing
+    Py_ssize_t cap;
+    uint8_t *tags;
+    int64_t *data;  // int value, double bits or offset into the arena
+    int64_t *str_len;
+
+    wchar_t *arena;
+    size_t arena_len;
+    size_t arena_cap;
+} Column;
+
+typedef struct __ColumnsDecoder {
+    JSONObjectDecoder dec;
+
+    Column *cols;
+    Py_ssize_t ncols;
+    Py_ssize_t cols_cap;
+    Py_ssize_t last_col;
+
+    Py_ssize_t nrows;
+    int depth;
+    int unsupported;  // not a list of flat objects
+    int no_memory;
+
+    ColValue slots[2];  // a key and its value are alive at the same time
+    int next_slot;
+    int marker;  // returned for the top level array and for records
+} ColumnsDecoder;
+
+static ColValue *Columns_slot(ColumnsDecoder *cd, int tag) {
+    ColValue *slot = &cd->slots[cd->next_slot];
+    if (cd->unsupported) {
+        // stop decoding at the next value
+        return NULL;
+    }
+    cd->next_slot ^= 1;
+    slot->tag = tag;
+    return slot;
+}
+
+static int Columns_isMarker(ColumnsDecoder *cd, JSOBJ obj) {
+    return obj == (JSOBJ)&cd->marker;
+}
+
+static JSOBJ Columns_newString(void *prv, wchar_t *start, wchar_t *end) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    ColValue *slot = Columns_slot(cd, TAG_STRING);
+    size_t len = end - start;
+
+    if (slot == NULL) {
+        return NULL;
+    }
+    if (len + 1 > slot->cap) {
+        wchar_t *str = realloc(slot->str, (len + 1) * sizeof(wchar_t));
+        if (str == NULL) {
+            cd->no_memory = 1;
+            return NULL;
+        }
+        slot->str = str;
+        slot->cap = len + 1;
+    }
+    memcpy(slot->str, start, len * sizeof(wchar_t));
+    slot->len = len;
+    return slot;
+}
+
+static JSOBJ Columns_newTrue(void *prv) {
+    return Columns_slot((ColumnsDecoder *)prv, TAG_TRUE);
+}
+
+static JSOBJ Columns_newFalse(void *prv) {
+    return Columns_slot((ColumnsDecoder *)prv, TAG_FALSE);
+}
+
+static JSOBJ Columns_newNull(void *prv) {
+    return Columns_slot((ColumnsDecoder *)prv, TAG_NULL);
+}
+
+static JSOBJ Columns_newDouble(void *prv, double value) {
+    ColValue *slot = Columns_slot((ColumnsDecoder *)prv, TAG_DOUBLE);
+    if (slot != NULL) {
+        slot->dval = value;
+    }
+    return slot;
+}
+
+static JSOBJ Columns_newPosInf(void *prv) {
+    return Columns_newDouble(prv, Py_HUGE_VAL);
+}
+
+static JSOBJ Columns_newNegInf(void *prv) {
+    return Columns_newDouble(prv, -Py_HUGE_VAL);
+}
+
+static JSOBJ Columns_newInteger(void *prv, JSINT32 value) {
+    ColValue *slot = Columns_slot((ColumnsDecoder *)prv, TAG_INT);
+    if (slot != NULL) {
+        slot->ival = value;
+    }
+    return slot;
+}
+
+static JSOBJ Columns_newLong(void *prv, JSINT64 value) {
+    ColValue *slot = Columns_slot((ColumnsDecoder *)prv, TAG_INT);
+    if (slot != NULL) {
+        slot->ival = value;
+    }
+    return slot;
+}
+
+static JSOBJ Columns_newContainer(void *prv, void *decoder) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    cd->depth++;
+    // depth 1 is the list of records, depth 2 a record, anything else is
+    // either nested or not a list at the top
+    if (cd->depth > 2) {
+        cd->unsupported = 1;
+    }
+    return &cd->marker;
+}
+
+static JSOBJ Columns_newArray(void *prv, void *decoder) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    if (cd->depth != 0) {
+        cd->unsupported = 1;
+    }
+    return Columns_newContainer(prv, decoder);
+}
+
+static JSOBJ Columns_newObject(void *prv, void *decoder) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    if (cd->depth != 1) {
+        cd->unsupported = 1;
+    }
+    return Columns_newContainer(prv, decoder);
+}
+
+static JSOBJ Columns_endContainer(void *prv, JSOBJ obj) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    cd->depth--;
+    return obj;
+}
+
+static int Columns_grow(Column *col, Py_ssize_t need) {
+    Py_ssize_t cap = col->cap ? col->cap : 1024;
+    uint8_t *tags;
+    int64_t *data;
+    int64_t *str_len;
+
+    while (cap < need) {
+        cap *= 2;
+    }
+    tags = realloc(col->tags, cap * sizeof(uint8_t));
+    if (tags == NULL) {
+        return 0;
+    }
+    col->tags = tags;
+    data = realloc(col->data, cap * sizeof(int64_t));
+    if (data == NULL) {
+        return 0;
+    }
+    col->data = data;
+    if (col->str_len != NULL) {
+        str_len = realloc(col->str_len, cap * sizeof(int64_t));
+        if (str_len == NULL) {
+            return 0;
+        }
+        col->str_len = str_len;
+    }
+    col->cap = cap;
+    return 1;
+}
+
+static Column *Columns_findColumn(ColumnsDecoder *cd, ColValue *key) {
+    Py_ssize_t i, j;
+    Column *col;
+
+    // records usually repeat their keys in the same order
+    for (j = 1; j <= cd->ncols; j++) {
+        i = (cd->last_col + j) % cd->ncols;
+        col = &cd->cols[i];
+        if (col->name_len == key->len &&
+            memcmp(col->name, key->str, key->len * sizeof(wchar_t)) == 0) {
+            cd->last_col = i;
+            return col;
+        }
+    }
+
+    if (cd->ncols == cd->cols_cap) {
+        Py_ssize_t cap = cd->cols_cap ? 2 * cd->cols_cap : 16;
+        Column *cols = realloc(cd->cols, cap * sizeof(Column));
+        if (cols == NULL) {
+            return NULL;
+        }
+        cd->cols = cols;
+        cd->cols_cap = cap;
+    }
+
+    col = &cd->cols[cd->ncols];
+    memset(col, 0, sizeof(Column));
+    col->name = malloc((key->len + 1) * sizeof(wchar_t));
+    if (col->name == NULL) {
+        return NULL;
+    }
+    memcpy(col->name, key->str, key->len * sizeof(wchar_t));
+    col->name_len = key->len;
+    cd->last_col = cd->ncols;
+    cd->ncols++;
+    return col;
+}
+
+static int Columns_storeString(Column *col, Py_ssize_t row, ColValue *value) {
+    if (col->str_len == NULL) {
+        col->str_len = malloc(col->cap * sizeof(int64_t));
+        if (col->str_len == NULL) {
+            return 0;
+        }
+    }
+    if (col->arena_len + value->len > col->arena_cap) {
+        size_t cap = col->arena_cap ? col->arena_cap : 4096;
+        wchar_t *arena;
+        while (cap < col->arena_len + value->len) {
+            cap *= 2;
+        }
+        arena = realloc(col->arena, cap * sizeof(wchar_t));
+        if (arena == NULL) {
+            return 0;
+        }
+        col->arena = arena;
+        col->arena_cap = cap;
+    }
+    memcpy(col->arena + col->arena_len, value->str,
+           value->len * sizeof(wchar_t));
+    col->data[row] = (int64_t)col->arena_len;
+    col->str_len[row] = (int64_t)value->len;
+    col->arena_len += value->len;
+    return 1;
+}
+
+static int Columns_objectAddKey(void *prv, JSOBJ obj, JSOBJ name,
+                                JSOBJ _value) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    ColValue *value = (ColValue *)_value;
+    Py_ssize_t row = cd->nrows;
+    Column *col;
+
+    if (cd->unsupported || Columns_isMarker(cd, _value)) {
+        cd->unsupported = 1;
+        return 0;
+    }
+
+    col = Columns_findColumn(cd, (ColValue *)name);
+    if (col == NULL || (row >= col->cap && !Columns_grow(col, row + 1))) {
+        cd->no_memory = 1;
+        return 0;
+    }
+    if (col->len <= row) {
+        // rows without this key so far
+        memset(col->tags + col->len, TAG_MISSING, row + 1 - col->len);
+        col->len = row + 1;
+    }
+    // otherwise a repeated key, the last value wins
+
+    col->tags[row] = (uint8_t)value->tag;
+    switch (value->tag) {
+        case TAG_INT:
+            col->data[row] = value->ival;
+            break;
+        case TAG_DOUBLE:
+            memcpy(&col->data[row], &value->dval, sizeof(double));
+            break;
+        case TAG_STRING:
+            if (!Columns_storeString(col, row, value)) {
+                cd->no_memory = 1;
+                return 0;
+            }
+            break;
+        default:
+            break;
+    }
+    return 1;
+}
+
+static int Columns_arrayAddItem(void *prv, JSOBJ obj, JSOBJ value) {
+    ColumnsDecoder *cd = (ColumnsDecoder *)prv;
+    if (cd->unsupported || !Columns_isMarker(cd, value)) {
+        // scalars or arrays in the list of records
+        cd->unsupported = 1;
+        return 0;
+    }
+    cd->nrows++;
+    return 1;
+}
+
+static void Columns_releaseObject(void *prv, JSOBJ obj, void *decoder) {}
+
+static void Columns_free(ColumnsDecoder *cd) {
+    Py_ssize_t i;
+    for (i = 0; i < cd->ncols; i++) {
+        free(cd->cols[i].name);
+        free(cd->cols[i].tags);
+        free(cd->cols[i].data);
+        free(cd->cols[i].str_len);
+        free(cd->cols[i].arena);
+    }
+    free(cd->cols);
+    free(cd->slots[0].str);
+    free(cd->slots[1].str);
+}
+
+// Build the numpy array for one column, filling rows past col->len as
+// missing (NaN).
+static PyObject *Columns_toArray(Column *col, Py_ssize_t nrows) {
+    npy_intp dims[1] = {nrows};
+    Py_ssize_t i, n_int = 0, n_double = 0, n_bool = 0, n_missing;
+    PyObject *arr, *item, *nan;
+    uint8_t tag;
+
+    for (i = 0; i < col->len; i++) {
+        tag = col->tags[i];
+        if (tag == TAG_INT) {
+            n_int++;
+        } else if (tag == TAG_DOUBLE) {
+            n_double++;
+        } else if (tag == TAG_TRUE || tag == TAG_FALSE) {
+            n_bool++;
+        }
+    }
+    n_missing = nrows - col->len;
+    for (i = 0; i < col->len; i++) {
+        n_missing += col->tags[i] == TAG_MISSING;
+    }
+
+    if (n_int == nrows) {
+        arr = PyArray_SimpleNew(1, dims, NPY_INT64);
+        if (arr != NULL) {
+            memcpy(PyArray_DATA((PyArrayObject *)arr), col->data,
+                   nrows * sizeof(int64_t));
+        }
+        return arr;
+    }
+    if (n_double > 0 && n_double + n_missing == nrows) {
+        double *out;
+        arr = PyArray_SimpleNew(1, dims, NPY_FLOAT64);
+        if (arr == NULL) {
+            return NULL;
+        }
+        out = (double *)PyArray_DATA((PyArrayObject *)arr);
+        for (i = 0; i < nrows; i++) {
+            if (i < col->len && col->tags[i] == TAG_DOUBLE) {
+                memcpy(&out[i], &col->data[i], sizeof(double));
+            } else {
+                out[i] = Py_NAN;
+            }
+        }
+        return arr;
+    }
+    if (n_bool == nrows) {
+        npy_bool *out;
+        arr = PyArray_SimpleNew(1, dims, NPY_BOOL);
+        if (arr == NULL) {
+            return NULL;
+        }
+        out = (npy_bool *)PyArray_DATA((PyArrayObject *)arr);
+        for (i = 0; i < nrows; i++) {
+            out[i] = col->tags[i] == TAG_TRUE;
+        }
+        return arr;
+    }
+
+    // mixed, string or null values: left to the caller's object inference,
+    // matching what DataFrame does with a list of dicts
+    arr = PyArray_SimpleNew(1, dims, NPY_OBJECT);
+    if (arr == NULL) {
+        return NULL;
+    }
+    nan = PyFloat_FromDouble(Py_NAN);
+    if (nan == NULL) {
+        Py_DECREF(arr);
+        return NULL;
+    }
+    for (i = 0; i < nrows; i++) {
+        double dval;
+        tag = i < col->len ? col->tags[i] : TAG_MISSING;
+        switch (tag) {
+            case TAG_NULL:
+                item = Py_None;
+                Py_INCREF(item);
+                break;
+            case TAG_TRUE:
+                item = Py_True;
+                Py_INCREF(item);
+                break;
+            case TAG_FALSE:
+                item = Py_False;
+                Py_INCREF(item);
+                break;
+            case TAG_INT:
+                item = PyLong_FromLongLong(col->data[i]);
+                break;
+            case TAG_DOUBLE:
+                memcpy(&dval, &col->data[i], sizeof(double));
+                item = PyFloat_FromDouble(dval);
+                break;
+            case TAG_STRING:
+                item = PyUnicode_FromWideChar(col->arena + col->data[i],
+                                              col->str_len[i]);
+                break;
+            default:
+                item = nan;
+                Py_INCREF(item);
+                break;
+        }
+        if (item == NULL) {
+            Py_DECREF(nan);
+            Py_DECREF(arr);
+            return NULL;
+        }
+        // the array was created filled with NULL, no reference to drop
+        ((PyObject **)PyArray_DATA((PyArrayObject *)arr))[i] = item;
+    }
+    Py_DECREF(nan);
+    return arr;
+}
+
+static char *g_kwlist[] = {"obj", "precise_float", NULL};
+
+PyObject *JSONToColumns(PyObject *self, PyObject *args, PyObject *kwargs) {
+    PyObject *arg, *sarg, *names = NULL, *arrays = NULL, *arr, *name;
+    PyObject *ret = NULL;
+    PyObject *opreciseFloat = NULL;
+    ColumnsDecoder cd;
+    JSOBJ decoded;
+    const char *buf;
+    Py_ssize_t i, buflen;
+
+    JSONObjectDecoder dec = {
+        Columns_newString,     Columns_objectAddKey,  Columns_arrayAddItem,
+        Columns_newTrue,       Columns_newFalse,      Columns_newNull,
+        Columns_newPosInf,     Columns_newNegInf,     Columns_newObject,
+        Columns_endContainer,  Columns_newArray,      Columns_endContainer,
+        Columns_newInteger,    Columns_newLong,       Columns_newDouble,
+        Columns_releaseObject, malloc,                free,
+        realloc};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", g_kwlist, &arg,
+                                     &opreciseFloat)) {
+        return NULL;
+    }
+
+    if (PyBytes_Check(arg)) {
+        sarg = arg;
+        Py_INCREF(sarg);
+    } else if (PyUnicode_Check(arg)) {
+        sarg = PyUnicode_AsUTF8String(arg);
+        if (sarg == NULL) {
+            return NULL;
+        }
+    } else {
+        PyErr_Format(PyExc_TypeError, "Expected 'str' or 'bytes'");
+        return NULL;
+    }
+
+    memset(&cd, 0, sizeof(ColumnsDecoder));
+    cd.dec = dec;
+    cd.dec.prv = &cd;
+    cd.dec.preciseFloat =
+        opreciseFloat != NULL && PyObject_IsTrue(opreciseFloat);
+
+    buf = PyBytes_AS_STRING(sarg);
+    buflen = PyBytes_GET_SIZE(sarg);
+
+    Py_BEGIN_ALLOW_THREADS;
+    decoded = JSON_DecodeObject(&cd.dec, buf, buflen);
+    Py_END_ALLOW_THREADS;
+
+    Py_DECREF(sarg);
+
+    if (cd.no_memory) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    if (cd.unsupported || (decoded != NULL && cd.nrows == 0)) {
+        Py_INCREF(Py_None);
+        ret = Py_None;
+        goto done;
+    }
+    if (decoded == NULL || cd.dec.errorStr) {
+        PyErr_Format(PyExc_ValueError, "%s",
+                     cd.dec.errorStr ? cd.dec.errorStr : "Expected object");
+        goto done;
+    }
+
+    names = PyList_New(cd.ncols);
+    arrays = PyList_New(cd.ncols);
+    if (names == NULL || arrays == NULL) {
+        goto done;
+    }
+    for (i = 0; i < cd.ncols; i++) {
+        name = PyUnicode_FromWideChar(cd.cols[i].name, cd.cols[i].name_len);
+        if (name == NULL) {
+            goto done;
+        }
+        PyList_SET_ITEM(names, i, name);
+
+        arr = Columns_toArray(&cd.cols[i], cd.nrows);
+        if (arr == NULL) {
+            goto done;
+        }
+        PyList_SET_ITEM(arrays, i, arr);
+    }
+
+    ret = Py_BuildValue("(OOn)", names, arrays, cd.nrows);
+
+done:
+    Py_XDECREF(names);
+    Py_XDECREF(arrays);
+    Columns_free(&cd);
+    return ret;
+}
@@ -2159,6 +2159,7 @@ PyObject *objToJSON(PyObject *Py_UNUSED(self), PyObject *args,
                              "iso_dates",
                              "default_handler",
                              "indent",
+                             "lines",
                              NULL};
 
     char buffer[65536];
@@ -2173,6 +2174,7 @@ PyObject *objToJSON(PyObject *Py_UNUSED(self), PyObject *args,
     PyObject *oisoDates = 0;
     PyObject *odefHandler = 0;
     int indent = 0;
+    int lines = 0;
 
     PyObjectEncoder pyEncoder = {{
         Object_beginTypeContext,
@@ -2209,10 +2211,11 @@ PyObject *objToJSON(PyObject *Py_UNUSED(self), PyObject *args,
 
     PRINTMARK();
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiOssOOi", kwlist,
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|OiOssOOip", kwlist,
                                      &oinput, &oensureAscii, &idoublePrecision,
                                      &oencodeHTMLChars, &sOrient, &sdateFormat,
-                                     &oisoDates, &odefHandler, &indent)) {
+                                     &oisoDates, &odefHandler, &indent,
+                                     &lines)) {
         return NULL;
     }
 
@@ -2279,6 +2282,7 @@ PyObject *objToJSON(PyObject *Py_UNUSED(self), PyObject *args,
     }
 
     encoder->indent = indent;
+    encoder->lines = lines;
 
     pyEncoder.originalOutputFormat = pyEncoder.outputFormat;
     PRINTMARK();
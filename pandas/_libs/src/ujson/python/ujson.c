@@ -46,6 +46,9 @@ void initObjToJSON(void);
 /* JSONToObj */
 PyObject *JSONToObj(PyObject *self, PyObject *args, PyObject *kwargs);
 
+/* JSONToColumns */
+PyObject *JSONToColumns(PyObject *self, PyObject *args, PyObject *kwargs);
+
 #define ENCODER_HELP_TEXT                                                  \
     "Use ensure_ascii=false to output UTF-8. Pass in double_precision to " \
     "alter the maximum digit precision of doubles. Set "                   \
@@ -62,6 +65,11 @@ static PyMethodDef ujsonMethods[] = {
     {"loads", (PyCFunction)JSONToObj, METH_VARARGS | METH_KEYWORDS,
      "Converts JSON as string to dict object structure. Use precise_float=True "
      "to use high precision float decoder."},
+    {"loads_columns", (PyCFunction)JSONToColumns, METH_VARARGS | METH_KEYWORDS,
+     "Decodes a JSON list of flat objects into a tuple of (column names, "
+     "column arrays, number of rows), or returns None if the document has "
+     "another structure. Use precise_float=True to use high precision float "
+     "decoder."},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 